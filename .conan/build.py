@@ -4,36 +4,48 @@
 import os
 import re
 import argparse
+import functools
 from cpt.packager import ConanMultiPackager
 
+@functools.lru_cache(maxsize=1)
 def username():
     return os.getenv("CONAN_USERNAME", "public-conan")
 
+@functools.lru_cache(maxsize=1)
 def login_username():
     return os.getenv("CONAN_LOGIN_USERNAME", "Twonington")
 
+@functools.lru_cache(maxsize=1)
 def upload():
     return os.getenv("CONAN_UPLOAD", "https://api.bintray.com/conan/twonington/public-conan")
 
+_TRUE = frozenset(("true", "1", "yes"))
+
+@functools.lru_cache(maxsize=1)
 def upload_only_when_stable():
-    return os.getenv("CONAN_UPLOAD_ONLY_WHEN_STABLE", "True").lower() in ["true", "1", "yes"]
+    return os.getenv("CONAN_UPLOAD_ONLY_WHEN_STABLE", "True").lower() in _TRUE
 
+@functools.lru_cache(maxsize=1)
 def channel():
     return os.getenv("CONAN_CHANNEL", "testing")
 
+@functools.lru_cache(maxsize=1)
 def stable_branch_pattern():
     return os.getenv("CONAN_STABLE_BRANCH_PATTERN", r"v\d+\.\d+\.\d+")
 
-def version():
-    version = 'latest'
+_VERSION_RE = re.compile(r'^\s*set\(\s*POLYMOPHIC_VALUE_VERSION\s+(\d+\.\d+\.\d+)\s*\)\s*(?:#.*)?$', re.MULTILINE)
+
+def _read_version():
     with open(os.path.join(os.path.dirname(__file__), "..", "CMakeLists.txt")) as file:
-        pattern = re.compile(r'set\(POLYMOPHIC_VALUE_VERSION (\d+\.\d+\.\d+)\)')
-        for line in file:
-            result = pattern.search(line)
-            if result:
-                version = result.group(1)
-    return version
+        result = _VERSION_RE.search(file.read())
+    return result.group(1) if result else 'latest'
+
+_VERSION = _read_version()
+
+def version():
+    return _VERSION
 
+@functools.lru_cache(maxsize=1)
 def reference():
     return os.getenv("CONAN_REFERENCE", "polymorphic_value/{}".format(version()))
 
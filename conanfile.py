@@ -1,8 +1,29 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 from conans import ConanFile, CMake
-from conans.tools import load
-import re, os
+from conans.tools import load, save
+from functools import lru_cache
+import hashlib, re, os
+
+try:
+    from functools import cached_property
+except ImportError:  # Python < 3.8
+    class cached_property(object):
+        def __init__(self, func):
+            self.func = func
+
+        def __get__(self, obj, cls):
+            if obj is None:
+                return self
+            value = obj.__dict__[self.func.__name__] = self.func(obj)
+            return value
+
+_VERSION_RE = re.compile(r"^\s*set\(\s*POLYMOPHIC_VALUE_VERSION\s+(\d+\.\d+\.\d+)\s*\)\s*(?:#.*)?$", re.MULTILINE)
+
+@lru_cache(maxsize=None)
+def _cmake_version():
+    content = load(os.path.join(os.path.dirname(__file__), "CMakeLists.txt"))
+    return _VERSION_RE.search(content).group(1)
 
 class PolymorphicValueConan(ConanFile):
     name = "polymorphic_value"
@@ -14,24 +35,34 @@ class PolymorphicValueConan(ConanFile):
     generators = "cmake"
 
     def set_version(self):
-        content = load(os.path.join(os.path.dirname(__file__), "CMakeLists.txt"))
-        version = re.search(r"set\(POLYMOPHIC_VALUE_VERSION (.*)\)", content).group(1)
-        self.version = version.strip()
+        self.version = _cmake_version()
 
-    _cmake = None
-    @property
+    @cached_property
     def cmake(self):
-        if self._cmake is None:
-            self._cmake = CMake(self)
-            self._cmake.definitions.update({
-                "BUILD_TESTING": False
-            })
-            self._cmake.configure()
-        return self._cmake
+        cmake = CMake(self)
+        cmake.definitions.update({
+            "BUILD_TESTING": False
+        })
+        self._configure_cmake(cmake)
+        return cmake
+
+    def _configure_cmake(self, cmake):
+        # Skip re-running CMake when the build tree was already configured
+        # with the same generator and definitions by an earlier conan invocation.
+        key = hashlib.sha1(repr((cmake.generator, sorted(cmake.definitions.items()))).encode()).hexdigest()
+        stamp = os.path.join(self.build_folder, ".conf_stamp")
+        cache = os.path.join(self.build_folder, "CMakeCache.txt")
+        if os.path.isfile(cache) and os.path.isfile(stamp) and load(stamp) == key:
+            return
+        cmake.configure()
+        # configure() is a no-op for build-only steps such as `conan build --build`,
+        # so only record the stamp when CMake actually ran.
+        if self.should_configure:
+            save(stamp, key)
 
     def build(self):
         self.cmake.build()
-        if self._cmake.definitions["BUILD_TESTING"]:
+        if self.cmake.definitions["BUILD_TESTING"]:
             self.cmake.test()
 
     def package(self):
@@ -2,17 +2,13 @@
 import sys
 import os
 import platform
+import shutil
 import subprocess
+import multiprocessing
 
 
-def check_for_executable(exe_name, args=["--version"]):
-    try:
-        cmd = [exe_name]
-        cmd.extend(args)
-        subprocess.check_output(cmd)
-        return True
-    except Exception:
-        return False
+def check_for_executable(exe_name):
+    return shutil.which(exe_name) is not None
 
 
 def main():
@@ -72,7 +68,14 @@ def main():
     else:
         if check_for_executable("ninja"):
             cmake_invocation.extend(["-GNinja"])
-        cmake_invocation.extend(["-DCMAKE_BUILD_TYPE={}".format(args.config)])
+        if check_for_executable("ccache"):
+            os.environ.setdefault("CCACHE_DIR", os.path.join(src_dir, ".ccache"))
+            cmake_invocation.extend(
+                [
+                    "-DCMAKE_C_COMPILER_LAUNCHER=ccache",
+                    "-DCMAKE_CXX_COMPILER_LAUNCHER=ccache",
+                ]
+            )
         cmake_invocation.append("-DCMAKE_BUILD_TYPE={}".format(args.config))
 
     if args.verbose:
@@ -81,14 +84,19 @@ def main():
     if args.sanitizers:
         cmake_invocation.append("-DENABLE_SANITIZERS:BOOL=ON")
 
+    jobs = multiprocessing.cpu_count()
+
     subprocess.check_call(cmake_invocation, cwd=src_dir)
     subprocess.check_call(
-        "cmake --build ./{}".format(args.out_dir).split(), cwd=src_dir
+        "cmake --build ./{} --parallel {}".format(args.out_dir, jobs).split(),
+        cwd=src_dir,
     )
 
     if args.run_tests:
         rc = subprocess.call(
-            "ctest . --output-on-failure -C {}".format(args.config).split(),
+            "ctest . -j {} --output-on-failure -C {}".format(
+                jobs, args.config
+            ).split(),
             cwd=os.path.join(src_dir, args.out_dir),
         )
         if rc != 0: